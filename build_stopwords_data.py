@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Build prebuilt stopword data for the stopwords module.
+
+Reads every language from the NLTK stopwords corpus once and writes a
+pickled {language: frozenset(words)} mapping to stopwords_data.pkl next to
+stopwords.py. When that file exists, stopwords.py loads it at import instead
+of parsing the NLTK corpus files. Re-run after upgrading NLTK or its data.
+
+Usage:
+    python build_stopwords_data.py
+"""
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from nltk.corpus import stopwords  # type: ignore
+
+# Must match _DATA_PATH in stopwords.py
+DATA_PATH = Path(__file__).with_name("stopwords_data.pkl")
+
+
+def main() -> None:
+    """Write the pickled stopword sets for all NLTK languages."""
+    data = {lang: frozenset(stopwords.words(lang)) for lang in stopwords.fileids()}
+
+    # Write to a temp file in the same directory, then atomically replace, so
+    # an interrupted build never leaves a half-written data file behind
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{DATA_PATH.name}.", suffix=".tmp", dir=DATA_PATH.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, DATA_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    print(f"Wrote {len(data)} languages to {DATA_PATH}")
+
+
+if __name__ == "__main__":
+    main()
+
+# fin
@@ -9,8 +9,24 @@ Tests cover all major functionality including:
 - Output format options (string vs list)
 - Error handling and edge cases
 """
+import io
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
-from stopwords import remove_stopwords, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, __version__
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+import stopwords
+from stopwords import (
+    remove_stopwords,
+    remove_stopwords_batch,
+    iter_remove_stopwords,
+    SUPPORTED_LANGUAGES,
+    DEFAULT_LANGUAGE,
+    __version__,
+)
 
 
 class TestRemoveStopwords(unittest.TestCase):
@@ -106,9 +122,9 @@ class TestRemoveStopwords(unittest.TestCase):
         self.assertNotIn("john's", result)
         self.assertNotIn("mary's", result)
 
-    def test_supported_languages_constant_is_set(self) -> None:
+    def test_supported_languages_constant_is_frozenset(self) -> None:
         """SUPPORTED_LANGUAGES should be populated."""
-        self.assertIsInstance(SUPPORTED_LANGUAGES, set)
+        self.assertIsInstance(SUPPORTED_LANGUAGES, frozenset)
         self.assertGreater(len(SUPPORTED_LANGUAGES), 0)
         self.assertIn("english", SUPPORTED_LANGUAGES)
 
@@ -162,6 +178,140 @@ class TestRemoveStopwords(unittest.TestCase):
         for word in result:
             self.assertTrue(len(word) > 0)
 
+    def test_contractions_kept_as_single_token(self) -> None:
+        """Contractions should be matched whole against the stopword list."""
+        text = "I don't know why it isn't working"
+        result = remove_stopwords(text, list_words=True)
+        self.assertEqual(result, ["know", "working"])
+
+    def test_cleaned_contractions_checked_against_stopwords(self) -> None:
+        """Contractions that clean to a stopword should be removed."""
+        result = remove_stopwords("we're here", list_words=True)
+        self.assertNotIn("were", result)
+        self.assertEqual(result, [])
+
+    def test_numbers_kept_whole(self) -> None:
+        """Decimals and thousands separators should not split numbers."""
+        text = "It costs $5.00, about 3.14 per 1,000 units"
+        result = remove_stopwords(text, list_words=True)
+        self.assertEqual(result, ["costs", "5.00", "3.14", "per", "1,000", "units"])
+
+    def test_numbers_with_units_kept_whole(self) -> None:
+        """Numbers followed by units should not split at the decimal point."""
+        result = remove_stopwords("A 3.5mm jack, 1.5-inch screen", list_words=True)
+        self.assertEqual(result, ["3.5mm", "jack", "1.5inch", "screen"])
+        result = remove_stopwords("3.5mm", punctuation=True, list_words=True)
+        self.assertEqual(result, ["3.5mm"])
+
+    def test_times_and_dates_kept_whole(self) -> None:
+        """Times, ratios and dates should stay single tokens."""
+        result = remove_stopwords("Meet 12:30 on 10/20/2020 in 16:9", list_words=True)
+        self.assertEqual(result, ["meet", "12:30", "10/20/2020", "16:9"])
+
+    def test_abbreviations_and_domains_kept_whole(self) -> None:
+        """Internal dots should not split abbreviations or domain names."""
+        result = remove_stopwords("The U.S.A. and bar.com", list_words=True)
+        self.assertEqual(result, ["u.s.a", "bar.com"])
+
+    def test_ellipsis_and_double_hyphen_are_single_tokens(self) -> None:
+        """With punctuation kept, "..." and "--" should stay single tokens."""
+        text = "Wait... no -- yes!"
+        result = remove_stopwords(text, punctuation=True, list_words=True)
+        self.assertEqual(result, ["wait", "...", "--", "yes", "!"])
+
+    def test_nltk_tokenizer_option(self) -> None:
+        """use_nltk_tokenizer=True should still remove stopwords."""
+        text = "This is a test of the stopwords removal system"
+        result = remove_stopwords(text, use_nltk_tokenizer=True)
+        self.assertEqual(result, "test stopwords removal system")
+
+    def test_cached_list_results_are_independent(self) -> None:
+        """Mutating a returned list should not affect later cached calls."""
+        remove_stopwords.cache_clear()  # type: ignore[attr-defined]
+        first = remove_stopwords("hello world test", list_words=True)
+        assert isinstance(first, list)
+        first.append("mutated")
+        second = remove_stopwords("hello world test", list_words=True)
+        self.assertEqual(second, ["hello", "world", "test"])
+
+
+class TestRemoveStopwordsBatch(unittest.TestCase):
+    """Test the remove_stopwords_batch function."""
+
+    texts = ["First document with stopwords", "", "John's book, the `test`!"]
+
+    def test_matches_single_document_results(self) -> None:
+        """Each result should equal remove_stopwords() on that text."""
+        result = remove_stopwords_batch(self.texts)
+        self.assertEqual(result, [remove_stopwords(text) for text in self.texts])
+
+    def test_list_words_returns_list_per_text(self) -> None:
+        """list_words=True should return one list of words per text."""
+        result = remove_stopwords_batch(self.texts, punctuation=True, list_words=True)
+        expected = [
+            remove_stopwords(text, punctuation=True, list_words=True)
+            for text in self.texts
+        ]
+        self.assertEqual(result, expected)
+
+    def test_empty_batch(self) -> None:
+        """No texts should produce no results."""
+        self.assertEqual(remove_stopwords_batch([]), [])
+
+
+class TestIterRemoveStopwords(unittest.TestCase):
+    """Test the iter_remove_stopwords generator."""
+
+    def test_returns_iterator(self) -> None:
+        """Should return a lazy iterator, not a list."""
+        result = iter_remove_stopwords("hello world")
+        self.assertIs(iter(result), result)
+
+    def test_matches_list_mode(self) -> None:
+        """Should yield the same words as remove_stopwords(list_words=True)."""
+        text = "John's book, the `test` and hello-world! 'quote'"
+        for punctuation in (False, True):
+            with self.subTest(punctuation=punctuation):
+                self.assertEqual(
+                    list(iter_remove_stopwords(text, punctuation=punctuation)),
+                    remove_stopwords(text, punctuation=punctuation, list_words=True),
+                )
+
+    def test_empty_input_yields_nothing(self) -> None:
+        """Empty input should produce no words."""
+        self.assertEqual(list(iter_remove_stopwords("")), [])
+
+
+class TestStopwordsData(unittest.TestCase):
+    """Test loading of the optional prebuilt stopwords_data.pkl."""
+
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.data_path = Path(tmp_dir.name) / "stopwords_data.pkl"
+        patcher = mock.patch.object(stopwords, "_DATA_PATH", self.data_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_missing_file_returns_none(self) -> None:
+        """A missing data file should fall back to the NLTK corpus."""
+        self.assertIsNone(stopwords._load_stopwords_data())
+
+    def test_valid_pickle_is_returned(self) -> None:
+        """A valid data file should be loaded as-is."""
+        data = {"english": frozenset({"the", "a"})}
+        self.data_path.write_bytes(pickle.dumps(data))
+        self.assertEqual(stopwords._load_stopwords_data(), data)
+
+    def test_corrupt_file_falls_back(self) -> None:
+        """A truncated data file should warn and fall back instead of raising."""
+        data = {"english": frozenset({"the", "a"})}
+        self.data_path.write_bytes(pickle.dumps(data)[:20])
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            self.assertIsNone(stopwords._load_stopwords_data())
+        self.assertIn("Warning", stderr.getvalue())
+
 
 class TestCLIIntegration(unittest.TestCase):
     """Test CLI functionality."""
@@ -178,6 +328,18 @@ class TestCLIIntegration(unittest.TestCase):
 
         self.assertEqual(main.__annotations__.get("return"), None)
 
+    def test_stdin_non_utf8_input(self) -> None:
+        """Invalid UTF-8 on stdin should warn and be replaced, not split words."""
+        script = Path(__file__).resolve().parent.parent / "stopwords.py"
+        proc = subprocess.run(
+            [sys.executable, str(script), "-w"],
+            input=b"caf\xe9 the world\r\n",
+            capture_output=True,
+            check=True,
+        )
+        self.assertIn(b"Warning: Input contains non-UTF-8 data", proc.stderr)
+        self.assertEqual(proc.stdout.decode("utf-8"), "caf\ufffd\nworld\n")
+
     def test_version_constant_exists(self) -> None:
         """__version__ constant should exist and be valid semver."""
         self.assertIsInstance(__version__, str)